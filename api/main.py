@@ -10,6 +10,7 @@ from backend.security.audit_logger import AuditMiddleware
 from backend.utils.paths import DATA_DIR
 from .init_volume import init_volume
 from .db_session import engine, Base
+from .models import ChatHistory
 
 # Initialize volume with backup database on first boot (for Railway)
 init_volume()
@@ -36,6 +37,19 @@ load_dotenv()
 # Create database tables automatically if they don't exist
 Base.metadata.create_all(bind=engine)
 
+# create_all() skips indexes on tables that already exist, so add any missing ones
+for index in ChatHistory.__table__.indexes:
+    index.create(bind=engine, checkfirst=True)
+
+# WAL lets request handlers read the users DB while another one writes (chat history,
+# config). journal_mode is stored in the database file, so setting it once here covers
+# every later connection to it; ConfigService's raw connections are included only when
+# ACCOUNTS_DATABASE_URL points at USERS_DB_PATH (the default). synchronous stays at
+# SQLite's default FULL: this DB holds password hashes and encrypted connection strings.
+if engine.dialect.name == "sqlite":
+    with engine.connect() as conn:
+        conn.exec_driver_sql("PRAGMA journal_mode=WAL")
+
 # Initialize the App
 app = FastAPI(title="Smart Financial Advisory (SFA)", version="2.0")
 
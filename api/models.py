@@ -1,6 +1,6 @@
 import enum
 from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, String, DateTime, Enum, ForeignKey, Text, Float, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Enum, ForeignKey, Text, Float, Boolean, Index
 from sqlalchemy.orm import relationship
 from .db_session import Base
 
@@ -83,4 +83,9 @@ class ChatHistory(Base):
     user_feedback = Column(Integer, nullable=True, default=None)
 
     # Link back to the User
-    user = relationship("User", back_populates="history")
\ No newline at end of file
+    user = relationship("User", back_populates="history")
+
+    # Covers the chat history lookups (user + session, ordered by time)
+    __table_args__ = (
+        Index("ix_chat_history_user_session_ts", "user_id", "session_id", "timestamp"),
+    )
\ No newline at end of file
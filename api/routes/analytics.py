@@ -11,6 +11,7 @@ from backend.core.logger import log_system_info, log_system_error
 from backend.services.config_service import ConfigService
 
 from backend.services.tenant_manager import MultiTenantDBManager
+from backend.data_mining.sqlite_manager import quote_identifier
 from backend.utils.formatters import format_value
 
 router = APIRouter(prefix="/api/dashboard", tags=["Analytics"])
@@ -124,11 +125,25 @@ def _fetch_configured_graph_data(
     if not x_table:
         return _empty_graph(title, chart_type)
     
+    # --- Data Filtering Logic ---
+    # "last_n" mode is pushed into SQL so only the needed rows leave the database
+    limit = None
+    if graph_config and hasattr(graph_config, 'data_range_mode') and graph_config.data_range_mode == "last_n":
+        limit = int(graph_config.data_range_limit or 12)
+    
     # Build query - include secondary column if present
     if x_secondary_name:
-        query = f'SELECT "{x_name}", "{x_secondary_name}", "{y_name}" FROM "{x_table}" ORDER BY "{x_name}", "{x_secondary_name}"'
+        order_cols = [quote_identifier(x_name), quote_identifier(x_secondary_name)]
+    else:
+        order_cols = [quote_identifier(x_name)]
+    select_cols = ", ".join(order_cols + [quote_identifier(y_name)])
+    query = f"SELECT {select_cols} FROM {quote_identifier(x_table)}"
+    
+    if limit:
+        # Newest N rows, flipped back to ascending order below
+        query += " ORDER BY " + ", ".join(f"{c} DESC" for c in order_cols) + f" LIMIT {limit}"
     else:
-        query = f'SELECT "{x_name}", "{y_name}" FROM "{x_table}" ORDER BY "{x_name}"'
+        query += " ORDER BY " + ", ".join(order_cols)
     
     result = MultiTenantDBManager.execute_query_for_user(user, query)
     
@@ -136,12 +151,8 @@ def _fetch_configured_graph_data(
         return _empty_graph(title, chart_type)
     
     rows = result["rows"]
-    
-    # --- Data Filtering Logic ---
-    if graph_config and hasattr(graph_config, 'data_range_mode') and graph_config.data_range_mode == "last_n":
-        limit = graph_config.data_range_limit or 12
-        if len(rows) > limit:
-            rows = rows[-limit:]
+    if limit:
+        rows = rows[::-1]
     
     # Build labels - combine if secondary column exists
     if x_secondary_name:
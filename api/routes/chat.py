@@ -32,6 +32,14 @@ from backend.pipeline.progress import (
 )
 
 
+def _is_usable_history_answer(answer: Optional[str]) -> bool:
+    """Only successful answers (not errors or iteration limits) are fed back as context."""
+    if not answer or "Agent stopped" in answer:
+        return False
+    answer_lower = answer.lower()
+    return "error" not in answer_lower[:50] and "iteration limit" not in answer_lower
+
+
 async def run_task_safely(task_func, query_id: str):
     """
     Runs the AI task with a timeout and cancellation support.
@@ -97,13 +105,7 @@ async def chat_endpoint(
         
         if last_chats:
             # Only include successful responses (not errors or iteration limits)
-            valid_chats = [
-                c for c in reversed(last_chats) 
-                if c.answer and 
-                   "error" not in c.answer.lower()[:50] and 
-                   "Agent stopped" not in c.answer and
-                   "iteration limit" not in c.answer.lower()
-            ]
+            valid_chats = [c for c in reversed(last_chats) if _is_usable_history_answer(c.answer)]
             if valid_chats:
                 # Limit context to last 2 exchanges and truncate answers
                 recent = valid_chats[-2:]
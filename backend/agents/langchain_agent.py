@@ -43,6 +43,11 @@ except ImportError:
 PRIMARY_MODEL = get_model("default")
 FALLBACK_MODEL = get_model("fast")
 
+# Precompiled patterns (used on every LLM callback / agent output)
+_THOUGHT_RE = re.compile(r"Thought:\s*(.+?)(?=\n|Action:|$)", re.DOTALL)
+_SCI_NOTATION_RE = re.compile(r"-?\d+\.?\d*e[+-]?\d+", re.I)
+_QUERY_NUM_RE = re.compile(r"(\d+)")
+
 
 class TaskMode(Enum):
     GRAPH = "graph"
@@ -52,6 +57,15 @@ class TaskMode(Enum):
     COMPARISON = "comparison"
 
 
+# Trigger phrases per task mode, checked in priority order by classify_task_mode
+_MODE_KEYWORDS = (
+    (TaskMode.GRAPH, ("plot", "chart", "graph", "visualiz", "trend", "show me", "display")),
+    (TaskMode.ADVISORY, ("should i", "recommend", "advice", "strategy", "invest", "danger")),
+    (TaskMode.COMPARISON, ("compare", "vs", "versus", "between", "difference")),
+    (TaskMode.AGGREGATION, ("total", "sum", "average", "avg", "count", "how many", "all time")),
+)
+
+
 def classify_task_mode(query: str) -> TaskMode:
     """Classify user query into ONE immutable task mode."""
     # Extract just the user's current query if context is present
@@ -61,17 +75,9 @@ def classify_task_mode(query: str) -> TaskMode:
     
     q = query.lower()
 
-    if any(k in q for k in ["plot", "chart", "graph", "visualiz", "trend", "show me", "display"]):
-        return TaskMode.GRAPH
-
-    if any(k in q for k in ["should i", "recommend", "advice", "strategy", "invest", "danger"]):
-        return TaskMode.ADVISORY
-
-    if any(k in q for k in ["compare", "vs", "versus", "between", "difference"]):
-        return TaskMode.COMPARISON
-
-    if any(k in q for k in ["total", "sum", "average", "avg", "count", "how many", "all time"]):
-        return TaskMode.AGGREGATION
+    for mode, keywords in _MODE_KEYWORDS:
+        if any(k in q for k in keywords):
+            return mode
 
     return TaskMode.LOOKUP
 
@@ -162,7 +168,7 @@ class ReasoningCallbackHandler(BaseCallbackHandler):
             return
 
         text = response.generations[0][0].text or ""
-        match = re.search(r"Thought:\s*(.+?)(?=\n|Action:|$)", text, re.DOTALL)
+        match = _THOUGHT_RE.search(text)
 
         if match:
             thought = match.group(1).strip()[:150]
@@ -237,8 +243,6 @@ Thought: {agent_scratchpad}
 
 def format_currency_number(text: str) -> str:
     """Format scientific notation numbers as currency."""
-    pattern = r"-?\d+\.?\d*e[+-]?\d+"
-
     def repl(m):
         n = float(m.group(0))
         a = abs(n)
@@ -249,7 +253,7 @@ def format_currency_number(text: str) -> str:
             return f"{s}${a/1e6:.2f}M"
         return f"{s}${a:.2f}"
 
-    return re.sub(pattern, repl, text, flags=re.I)
+    return _SCI_NOTATION_RE.sub(repl, text)
 
 
 def extract_value_from_table(table: str) -> str:
@@ -307,8 +311,7 @@ class LangChainAgent:
             try:
                 from evaluation.sfa_evaluator import SIMULATE_RATE_LIMIT_AT_QUERY
                 if SIMULATE_RATE_LIMIT_AT_QUERY > 0 and self.query_id:
-                    import re
-                    match = re.search(r'(\d+)', str(self.query_id))
+                    match = _QUERY_NUM_RE.search(str(self.query_id))
                     if match:
                         current_query_num = int(match.group(1))
                         if current_query_num >= SIMULATE_RATE_LIMIT_AT_QUERY:
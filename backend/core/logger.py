@@ -85,8 +85,11 @@ def log_agent_interaction(interaction_id: str, agent_name: str, task: str, input
         try: output_data = json.loads(output_data)
         except json.JSONDecodeError: output_data = output_data.split("\\n")
 
+    # One timestamp per call, shared by the step and the interaction record
+    now_iso = datetime.now().isoformat()
+
     step_entry = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now_iso,
         "agent": agent_name,
         "task": task,
         "input": input_data,
@@ -132,8 +135,9 @@ def log_agent_interaction(interaction_id: str, agent_name: str, task: str, input
 
             # Update Logic
             # Find existing interaction or create new
+            # Search newest-first: the active interaction is almost always the last record
             target_interaction = None
-            for interaction in data:
+            for interaction in reversed(data):
                 if interaction.get("interaction_id") == interaction_id:
                     target_interaction = interaction
                     break
@@ -141,12 +145,12 @@ def log_agent_interaction(interaction_id: str, agent_name: str, task: str, input
             if target_interaction:
                 if "steps" not in target_interaction: target_interaction["steps"] = []
                 target_interaction["steps"].append(step_entry)
-                target_interaction["last_updated"] = datetime.now().isoformat()
+                target_interaction["last_updated"] = now_iso
             else:
                 data.append({
                     "interaction_id": interaction_id,
-                    "created_at": datetime.now().isoformat(),
-                    "last_updated": datetime.now().isoformat(),
+                    "created_at": now_iso,
+                    "last_updated": now_iso,
                     "steps": [step_entry]
                 })
 
@@ -7,10 +7,13 @@ Loads CSV into a temp SQLite file for SQL querying (thread-safe).
 
 import os
 import csv
+import itertools
 import sqlite3
 import tempfile
 from typing import Dict, List, Any, Optional
 
+from .sqlite_manager import MMAP_SIZE_BYTES, quote_identifier
+
 
 class CSVManager:
     """
@@ -54,6 +57,10 @@ class CSVManager:
                 os.remove(self.db_path)
             
             conn = sqlite3.connect(self.db_path)
+            # Throwaway file rebuilt from the CSV on every connect: skip the rollback
+            # journal and fsyncs for the bulk load (both settings are per-connection)
+            conn.execute("PRAGMA journal_mode=OFF")
+            conn.execute("PRAGMA synchronous=OFF")
             
             # Derive table name from filename
             self.table_name = self._clean_name(csv_name)
@@ -65,42 +72,28 @@ class CSVManager:
                 self.clean_headers = [self._clean_name(h) for h in self.original_headers]
                 
                 # Detect column types from first few rows
-                sample_rows = []
-                for i, row in enumerate(reader):
-                    if i < 100:  # Sample first 100 rows for type detection
-                        sample_rows.append(row)
-                    else:
-                        break
+                sample_rows = list(itertools.islice(reader, 100))  # Sample first 100 rows for type detection
                 
                 # Infer column types
                 column_types = self._infer_column_types(sample_rows)
                 
                 # Create table with inferred types
                 columns_def = ", ".join([
-                    f'"{h}" {column_types.get(h, "TEXT")}' 
+                    f'{quote_identifier(h)} {column_types.get(h, "TEXT")}' 
                     for h in self.clean_headers
                 ])
-                conn.execute(f'CREATE TABLE "{self.table_name}" ({columns_def})')
+                conn.execute(f'CREATE TABLE {quote_identifier(self.table_name)} ({columns_def})')
                 
-                # Insert sample rows
+                # Bulk insert with one prepared statement (single transaction, committed below)
                 placeholders = ", ".join(["?" for _ in self.clean_headers])
-                for row in sample_rows:
-                    if len(row) == len(self.clean_headers):
-                        conn.execute(
-                            f'INSERT INTO "{self.table_name}" VALUES ({placeholders})',
-                            row
-                        )
+                insert_sql = f'INSERT INTO {quote_identifier(self.table_name)} VALUES ({placeholders})'
+                column_count = len(self.clean_headers)
                 
-                # Continue inserting remaining rows
-                f.seek(0)
-                reader = csv.reader(f)
-                next(reader)  # Skip header
-                for i, row in enumerate(reader):
-                    if i >= 100 and len(row) == len(self.clean_headers):
-                        conn.execute(
-                            f'INSERT INTO "{self.table_name}" VALUES ({placeholders})',
-                            row
-                        )
+                # Sample rows first, then stream the rest of the same reader (single pass over the file)
+                conn.executemany(
+                    insert_sql,
+                    (row for row in itertools.chain(sample_rows, reader) if len(row) == column_count)
+                )
                 
                 conn.commit()
             
@@ -115,7 +108,10 @@ class CSVManager:
     
     def _get_connection(self) -> sqlite3.Connection:
         """Get a new thread-safe connection to the temp database."""
-        return sqlite3.connect(self.db_path, check_same_thread=False)
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute(f"PRAGMA mmap_size={MMAP_SIZE_BYTES}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
     
     def _clean_name(self, name: str) -> str:
         """Clean a name to be SQL-safe."""
@@ -233,8 +229,10 @@ class CSVManager:
             conn = self._get_connection()
             cursor = conn.cursor()
             
+            quoted = quote_identifier(table_name)
+            
             # Get column info
-            cursor.execute(f'PRAGMA table_info("{table_name}")')
+            cursor.execute(f'PRAGMA table_info({quoted})')
             columns = []
             for row in cursor.fetchall():
                 columns.append({
@@ -246,7 +244,7 @@ class CSVManager:
                 })
             
             # Get row count
-            cursor.execute(f'SELECT COUNT(*) FROM "{table_name}"')
+            cursor.execute(f'SELECT COUNT(*) FROM {quoted}')
             row_count = cursor.fetchone()[0]
             
             conn.close()
@@ -284,14 +282,18 @@ class CSVManager:
             "table_count": len(tables)
         }
     
-    def get_schema_for_llm(self) -> str:
+    def get_schema_for_llm(self, schema: Optional[Dict[str, Any]] = None) -> str:
         """
         Get formatted schema string for LLM consumption.
         
+        Args:
+            schema: Optional result of get_full_schema() to reuse instead of re-reading it
+            
         Returns:
             Formatted schema string
         """
-        schema = self.get_full_schema()
+        if schema is None:
+            schema = self.get_full_schema()
         parts = []
         
         for table_name, table_info in schema.get("schema", {}).items():
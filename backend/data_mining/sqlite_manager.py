@@ -9,6 +9,15 @@ import sqlite3
 from typing import Dict, List, Any, Optional
 
 
+# Memory-map up to 256 MB of each user database (read path; SQLite falls back to normal I/O past it)
+MMAP_SIZE_BYTES = 256 * 1024 * 1024
+
+
+def quote_identifier(name: str) -> str:
+    """Quote a table/column name for SQLite (handles spaces, numeric names and embedded quotes)."""
+    return '"' + str(name).replace('"', '""') + '"'
+
+
 class SQLiteManager:
     """
     Manager for SQLite database files.
@@ -28,7 +37,11 @@ class SQLiteManager:
     
     def _get_connection(self) -> sqlite3.Connection:
         """Get a new thread-safe connection."""
-        return sqlite3.connect(self.db_path, check_same_thread=False)
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        # Read-heavy access: memory-map the file and keep temp b-trees (sorts, GROUP BY) in RAM
+        conn.execute(f"PRAGMA mmap_size={MMAP_SIZE_BYTES}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
     
     def connect(self) -> bool:
         """
@@ -86,36 +99,43 @@ class SQLiteManager:
         except Exception as e:
             return {"success": False, "message": f"Connection failed: {str(e)}"}
     
-    def get_tables(self) -> List[str]:
+    def get_tables(self, conn: Optional[sqlite3.Connection] = None) -> List[str]:
         """
         Get all table names from the database.
         
+        Args:
+            conn: Optional open connection to reuse (closed by the caller)
+        
         Returns:
             List of table names
         """
         if not self.is_connected:
             self.connect()
         
+        owns_conn = conn is None
         try:
-            conn = self._get_connection()
+            if owns_conn:
+                conn = self._get_connection()
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT name FROM sqlite_master 
                 WHERE type='table' AND name NOT LIKE 'sqlite_%' AND name NOT LIKE '_sfa_%'
             """)
-            tables = [row[0] for row in cursor.fetchall()]
-            conn.close()
-            return tables
+            return [row[0] for row in cursor.fetchall()]
         except Exception as e:
             print(f"get_tables error: {e}")
             return []
+        finally:
+            if owns_conn and conn is not None:
+                conn.close()
     
-    def get_table_schema(self, table_name: str) -> Dict[str, Any]:
+    def get_table_schema(self, table_name: str, conn: Optional[sqlite3.Connection] = None) -> Dict[str, Any]:
         """
         Get detailed schema for a specific table.
         
         Args:
             table_name: Name of the table
+            conn: Optional open connection to reuse (closed by the caller)
             
         Returns:
             Dict with columns, types, count, primary_key, foreign_keys
@@ -123,12 +143,16 @@ class SQLiteManager:
         if not self.is_connected:
             self.connect()
         
+        owns_conn = conn is None
         try:
-            conn = self._get_connection()
+            if owns_conn:
+                conn = self._get_connection()
             cursor = conn.cursor()
             
+            quoted = quote_identifier(table_name)
+            
             # Get column info
-            cursor.execute(f"PRAGMA table_info('{table_name}')")
+            cursor.execute(f"PRAGMA table_info({quoted})")
             columns = []
             primary_key = None
             for row in cursor.fetchall():
@@ -144,11 +168,11 @@ class SQLiteManager:
                     primary_key = row[1]
             
             # Get row count
-            cursor.execute(f"SELECT COUNT(*) FROM '{table_name}'")
+            cursor.execute(f"SELECT COUNT(*) FROM {quoted}")
             row_count = cursor.fetchone()[0]
             
             # Get foreign keys
-            cursor.execute(f"PRAGMA foreign_key_list('{table_name}')")
+            cursor.execute(f"PRAGMA foreign_key_list({quoted})")
             foreign_keys = []
             for row in cursor.fetchall():
                 foreign_keys.append({
@@ -158,11 +182,9 @@ class SQLiteManager:
                 })
             
             # Get indexes
-            cursor.execute(f"PRAGMA index_list('{table_name}')")
+            cursor.execute(f"PRAGMA index_list({quoted})")
             indexes = [row[1] for row in cursor.fetchall()]
             
-            conn.close()
-            
             return {
                 "table_name": table_name,
                 "columns": columns,
@@ -174,6 +196,9 @@ class SQLiteManager:
             }
         except Exception as e:
             return {"error": str(e)}
+        finally:
+            if owns_conn and conn is not None:
+                conn.close()
     
     def get_full_schema(self) -> Dict[str, Any]:
         """
@@ -182,11 +207,22 @@ class SQLiteManager:
         Returns:
             Dict with tables list and detailed schema for each
         """
-        tables = self.get_tables()
+        tables = []
         schema = {}
         
-        for table in tables:
-            schema[table] = self.get_table_schema(table)
+        # One connection (and warm page cache) for the table list and every table
+        conn = None
+        try:
+            conn = self._get_connection()
+            tables = self.get_tables(conn=conn)
+            for table in tables:
+                schema[table] = self.get_table_schema(table, conn=conn)
+        except sqlite3.DatabaseError as e:
+            # Unreadable / non-SQLite file: report no tables, as get_tables does
+            print(f"get_full_schema error: {e}")
+        finally:
+            if conn is not None:
+                conn.close()
         
         return {
             "success": True,
@@ -195,14 +231,18 @@ class SQLiteManager:
             "table_count": len(tables)
         }
     
-    def get_schema_for_llm(self) -> str:
+    def get_schema_for_llm(self, schema: Optional[Dict[str, Any]] = None) -> str:
         """
         Get formatted schema string for LLM consumption.
         
+        Args:
+            schema: Optional result of get_full_schema() to reuse instead of re-reading it
+            
         Returns:
             Formatted schema string
         """
-        schema = self.get_full_schema()
+        if schema is None:
+            schema = self.get_full_schema()
         parts = []
         
         for table_name, table_info in schema.get("schema", {}).items():
@@ -11,15 +11,29 @@ Flow:
 NO LLM-generated chart code. All chart rendering is done in frontend with hardcoded templates.
 """
 import json
+import re
 from typing import Dict, Any, Optional, List
 from backend.utils.llm_client import groq_client, get_model
 from backend.utils.formatters import parse_financial_value, is_percentage_column
-from backend.utils.table_parser import parse_markdown_table, extract_labels_and_values
+from backend.utils.table_parser import (
+    parse_markdown_table,
+    extract_labels_and_values,
+    YEAR_COLUMN_PREFIXES,
+    QUARTER_COLUMN_PREFIXES,
+    DATE_COLUMN_PATTERNS,
+)
 from backend.core.logger import log_system_debug, log_system_error
 
 # Fast model for chart type selection
 FAST_MODEL = get_model("fast")
 
+# First {...} block in the metadata reply (the model sometimes wraps it in prose)
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+# Value-column preference order and the identifier columns skipped in the fallback
+_PREFERRED_VALUE_COLUMNS = ('actual_value', 'revenue', 'value', 'val', 'close', 'total', 'margin', 'pct')
+_NON_VALUE_COLUMNS = frozenset(('yr', 'qtr', 'mo', 'wk', 'date', 'quarter', 'month', 'status', 'metric'))
+
 def generate_title(question: str) -> str:
     """Helper alias for tests."""
     return get_chart_metadata(question, "")["title"]
@@ -67,8 +81,7 @@ RESPOND WITH ONLY THIS JSON FORMAT (no markdown, no explanation):
         result_text = response.choices[0].message.content.strip()
         
         # Parse JSON response
-        import re
-        json_match = re.search(r'\{.*\}', result_text, re.DOTALL)
+        json_match = _JSON_OBJECT_RE.search(result_text)
         if json_match:
             metadata = json.loads(json_match.group())
             chart_type = metadata.get("chart_type", "bar").lower()
@@ -176,27 +189,14 @@ def parse_table_result(result_text: str) -> Optional[Dict[str, List]]:
     qtr_col_idx = None
     date_col_idx = None
     
-    year_patterns = ['yr', 'year', 'fiscal_year', 'fy']
-    qtr_patterns = ['qtr', 'quarter', 'fiscal_quarter', 'q']
-    date_patterns = ['date', 'month', 'mo', 'period', 'time']
-    
     for i, col in enumerate(columns):
         col_lower = col.lower()
-        if year_col_idx is None:
-            for pattern in year_patterns:
-                if pattern == col_lower or col_lower.startswith(pattern):
-                    year_col_idx = i
-                    break
-        if qtr_col_idx is None:
-            for pattern in qtr_patterns:
-                if pattern == col_lower or col_lower.startswith(pattern):
-                    qtr_col_idx = i
-                    break
-        if date_col_idx is None:
-            for pattern in date_patterns:
-                if pattern in col_lower:
-                    date_col_idx = i
-                    break
+        if year_col_idx is None and col_lower.startswith(YEAR_COLUMN_PREFIXES):
+            year_col_idx = i
+        if qtr_col_idx is None and col_lower.startswith(QUARTER_COLUMN_PREFIXES):
+            qtr_col_idx = i
+        if date_col_idx is None and any(pattern in col_lower for pattern in DATE_COLUMN_PATTERNS):
+            date_col_idx = i
     
     log_system_debug(f"[GraphPipeline] Column detection: year_col={year_col_idx}, qtr_col={qtr_col_idx}, date_col={date_col_idx}")
     
@@ -215,11 +215,10 @@ def parse_table_result(result_text: str) -> Optional[Dict[str, List]]:
             labels.append(row[0])
     
     # Find best value column - now includes percentage columns
-    preferred_cols = ['actual_value', 'revenue', 'value', 'val', 'close', 'total', 'margin', 'pct']
     value_col_idx = len(columns) - 1
     is_pct = False
     
-    for preferred in preferred_cols:
+    for preferred in _PREFERRED_VALUE_COLUMNS:
         for i, col in enumerate(columns):
             if preferred in col:
                 value_col_idx = i
@@ -230,7 +229,7 @@ def parse_table_result(result_text: str) -> Optional[Dict[str, List]]:
     else:
         for i in range(len(columns) - 1, -1, -1):
             col_name = columns[i]
-            if col_name in ['yr', 'qtr', 'mo', 'wk', 'date', 'quarter', 'month', 'status', 'metric']:
+            if col_name in _NON_VALUE_COLUMNS:
                 continue
             value_col_idx = i
             break
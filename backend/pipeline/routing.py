@@ -130,8 +130,8 @@ def run_text_query_pipeline(question: str, query_id: str = None, user=None) -> s
         return result
 
     except Exception as e:
-        error_msg = traceback.format_exc()
-        log_system_error(f"Text Query Pipeline Failed: {str(e)}", error_msg)
+        # log_system_error takes a single message: append the traceback to it
+        log_system_error(f"Text Query Pipeline Failed: {str(e)}\n{traceback.format_exc()}")
         return {
             "output": f"I encountered an error processing your request: {str(e)}",
             "steps": 0
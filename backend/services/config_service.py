@@ -5,14 +5,20 @@ Stores configuration in the USERS database (not the financial database).
 """
 
 import json
+import re
 import sqlite3
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 from api.config_models import DashboardConfig, TrafficLightConfig, GraphConfig
 from backend.services.tenant_manager import MultiTenantDBManager
+from backend.data_mining.sqlite_manager import quote_identifier
 from backend.core.logger import log_system_error, log_system_info
 from backend.utils.paths import USERS_DB_PATH
 
+# Whitelist for KPI expressions: word characters, whitespace and arithmetic only
+_EXPRESSION_CHARS_RE = re.compile(r'^[\w\s\+\-\*\/\(\)\.]+$')
+_TABLE_COLUMN_RE = re.compile(r'(\w+)\.(\w+)')
+
 
 class ConfigService:
     """Service for managing user dashboard configurations stored in users DB."""
@@ -112,24 +118,19 @@ class ConfigService:
             conn = ConfigService._get_connection()
             cursor = conn.cursor()
             
-            # Check if table exists first
-            cursor.execute(f"""
-                SELECT name FROM sqlite_master 
-                WHERE type='table' AND name='{ConfigService.CONFIG_TABLE_NAME}'
-            """)
-            
-            if not cursor.fetchone():
+            # Fetch config in a single round trip; a missing table means nothing saved yet
+            try:
+                cursor.execute(f"""
+                    SELECT config_value FROM {ConfigService.CONFIG_TABLE_NAME}
+                    WHERE user_id = ? AND config_key = ?
+                """, (user.id, ConfigService.DASHBOARD_CONFIG_KEY))
+                row = cursor.fetchone()
+            except sqlite3.OperationalError as e:
+                if "no such table" not in str(e):
+                    raise
+                row = None  # Table doesn't exist yet
+            finally:
                 conn.close()
-                return None  # Table doesn't exist yet
-            
-            # Fetch config
-            cursor.execute(f"""
-                SELECT config_value FROM {ConfigService.CONFIG_TABLE_NAME}
-                WHERE user_id = ? AND config_key = ?
-            """, (user.id, ConfigService.DASHBOARD_CONFIG_KEY))
-            
-            row = cursor.fetchone()
-            conn.close()
             
             if row:
                 config_json = row[0]
@@ -158,7 +159,7 @@ class ConfigService:
             return []
         
         # SQLite PRAGMA for table info - uses user's financial DB
-        pragma_sql = f"PRAGMA table_info({table_name})"
+        pragma_sql = f"PRAGMA table_info({quote_identifier(table_name)})"
         
         try:
             result = MultiTenantDBManager.execute_query_for_user(user, pragma_sql)
@@ -200,8 +201,7 @@ class ConfigService:
             return {"success": False, "error": "Empty expression"}
         
         # Basic security: only allow alphanumeric, spaces, and math operators
-        import re
-        if not re.match(r'^[\w\s\+\-\*\/\(\)\.]+$', expression):
+        if not _EXPRESSION_CHARS_RE.match(expression):
             return {"success": False, "error": "Invalid characters in expression"}
         
         try:
@@ -209,7 +209,7 @@ class ConfigService:
             # We need to find the table to query - extract from column references
             
             # Try to detect table from expression (look for table.column patterns)
-            table_match = re.search(r'(\w+)\.(\w+)', expression)
+            table_match = _TABLE_COLUMN_RE.search(expression)
             if table_match:
                 table_name = table_match.group(1)
             
@@ -227,7 +227,7 @@ class ConfigService:
                 return {"success": False, "error": "Could not determine table"}
             
             # Clean expression for SQL (remove table prefixes for simpler query)
-            clean_expr = re.sub(r'(\w+)\.(\w+)', r'\2', expression)
+            clean_expr = _TABLE_COLUMN_RE.sub(r'\2', expression)
             
             # Query latest row and evaluate expression
             eval_sql = f"SELECT ({clean_expr}) as result FROM {table_name} ORDER BY rowid DESC LIMIT 1"
@@ -221,7 +221,8 @@ class MultiTenantDBManager:
             return {"success": False, "message": "No database connected"}
         
         full_schema = manager.get_full_schema()
-        schema_for_llm = manager.get_schema_for_llm()
+        # Reuse the schema just read rather than scanning every table a second time
+        schema_for_llm = manager.get_schema_for_llm(full_schema)
         
         log_system_info(f"[TenantManager] User {user.id}: Schema retrieved - tables={list(full_schema.get('schema', {}).keys())}, llm_len={len(schema_for_llm) if schema_for_llm else 0}")
         
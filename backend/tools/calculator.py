@@ -4,11 +4,20 @@ Calculator Tool
 Provides safe mathematical evaluation for financial data arrays.
 Wraps Python's eval() in a restricted scope to prevent code execution attacks.
 """
+import re
 from typing import List, Dict, Union, Any
 import pandas as pd
 import numpy as np
 from langchain_core.tools import Tool
 
+# Suffixed amounts the LLM passes in (4.58B, 814.08M, 50K), compiled once
+_SUFFIXED_AMOUNT_RE = re.compile(r'(\d+\.?\d*)([BMK])', re.I)
+_SUFFIX_MULTIPLIERS = {'B': 1e9, 'M': 1e6, 'K': 1e3}
+
+def _expand_suffix(match: re.Match) -> str:
+    """Replace a matched suffixed amount with its plain numeric value."""
+    return str(float(match.group(1)) * _SUFFIX_MULTIPLIERS[match.group(2).upper()])
+
 def safe_calculate(expression: str, data_context: List[Dict[str, Any]] = None) -> str:
     """
     Evaluates a math expression on a dataset.
@@ -28,12 +37,9 @@ def safe_calculate(expression: str, data_context: List[Dict[str, Any]] = None) -
             expression = expression[1:-1]
         
         # Sanitize: remove $ symbols and convert B/M/K to actual numbers
-        import re
         expression = expression.replace('$', '')
         # Convert 4.58B to 4580000000, 814.08M to 814080000, etc.
-        expression = re.sub(r'(\d+\.?\d*)B', lambda m: str(float(m.group(1)) * 1e9), expression, flags=re.I)
-        expression = re.sub(r'(\d+\.?\d*)M', lambda m: str(float(m.group(1)) * 1e6), expression, flags=re.I)
-        expression = re.sub(r'(\d+\.?\d*)K', lambda m: str(float(m.group(1)) * 1e3), expression, flags=re.I)
+        expression = _SUFFIXED_AMOUNT_RE.sub(_expand_suffix, expression)
         
         if not data_context:
             # Simple scalar math
@@ -8,6 +8,9 @@ import pandas as pd
 from typing import List, Dict, Any, Optional
 from backend.utils.formatters import format_financial_value, format_date
 
+# Write/DDL keywords rejected by execute_sql_query (matched as substrings, reported in this order)
+_UNSAFE_KEYWORDS = ("drop", "delete", "update", "insert", "alter", "create", "truncate")
+
 
 def execute_sql_query(query: str, user=None) -> str:
     """
@@ -29,8 +32,7 @@ def execute_sql_query(query: str, user=None) -> str:
         return "Error: Only SELECT statements are allowed."
     
     # Block dangerous operations
-    unsafe_keywords = ["drop", "delete", "update", "insert", "alter", "create", "truncate"]
-    for keyword in unsafe_keywords:
+    for keyword in _UNSAFE_KEYWORDS:
         if keyword in normalized:
             return f"Error: Unsafe SQL keyword '{keyword}' detected."
 
@@ -4,12 +4,18 @@ Financial Value Formatters
 Unified functions for parsing and formatting financial values.
 Consolidates duplicate logic from graph_pipeline.py, graph_builder.py, and sql_tools.py
 """
+from functools import lru_cache
 from typing import Union
 
+# Magnitude suffixes recognised by parse_financial_value
+_SUFFIX_MULTIPLIERS = {'T': 1e12, 'B': 1e9, 'M': 1e6, 'K': 1e3}
 
+
+@lru_cache(maxsize=4096, typed=True)
 def parse_financial_value(value_str: str) -> float:
     """
     Parse formatted financial value strings to float.
+    Memoized: table cells repeat heavily across graph and agent output parsing.
     
     Examples:
         "$219.66B" -> 219660000000.0
@@ -30,18 +36,8 @@ def parse_financial_value(value_str: str) -> float:
     cleaned = str(value_str).replace('$', '').replace(',', '').replace('%', '').strip()
     
     # Handle suffixes
-    multiplier = 1
-    if cleaned.endswith('T'):
-        multiplier = 1e12
-        cleaned = cleaned[:-1]
-    elif cleaned.endswith('B'):
-        multiplier = 1e9
-        cleaned = cleaned[:-1]
-    elif cleaned.endswith('M'):
-        multiplier = 1e6
-        cleaned = cleaned[:-1]
-    elif cleaned.endswith('K'):
-        multiplier = 1e3
+    multiplier = _SUFFIX_MULTIPLIERS.get(cleaned[-1:], 1)
+    if multiplier != 1:
         cleaned = cleaned[:-1]
     
     try:
@@ -175,6 +171,13 @@ def format_percentage(val: Union[int, float, None], decimal_places: int = 1) ->
         return "-"
 
 
+# Column-name fragments that mark percentage data (built once, not per call)
+PERCENTAGE_INDICATORS = (
+    'margin', 'pct', 'percent', 'percentage', 'rate', 'ratio',
+    'growth', 'return', 'volatility', 'yield'
+)
+
+
 def is_percentage_column(column_name: str) -> bool:
     """
     Check if a column name indicates percentage data.
@@ -186,16 +189,7 @@ def is_percentage_column(column_name: str) -> bool:
         True if column appears to contain percentage data
     """
     col_lower = column_name.lower()
-    percentage_indicators = [
-        'margin', 'pct', 'percent', 'percentage', 'rate', 'ratio',
-        'growth', 'return', 'volatility', 'yield'
-    ]
-    
-    for indicator in percentage_indicators:
-        if indicator in col_lower:
-            return True
-    
-    return False
+    return any(indicator in col_lower for indicator in PERCENTAGE_INDICATORS)
 
 
 def format_number(val) -> str:
@@ -217,11 +211,15 @@ def format_number(val) -> str:
         return str(val)
 
 
+@lru_cache(maxsize=1024, typed=True)
 def format_value(value, format_type: str = "text") -> str:
     """
     Format a value based on the specified type.
     
     This is the main dispatcher for dynamic formatting based on user-defined types.
+    Results are memoized: it is a pure function of (value, format_type) and dashboard
+    graphs/tickers format the same column values on every refresh.
+    Values must be hashable scalars (as returned by SQLite).
     
     Supported types:
     - text (default): Returns str(value)
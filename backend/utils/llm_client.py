@@ -6,6 +6,7 @@ Includes API call counter for monitoring usage.
 """
 from groq import Groq
 import os
+import sys
 from dotenv import load_dotenv
 
 # Load environment variables once
@@ -60,9 +61,15 @@ def print_api_summary():
     """Print a summary of API usage."""
     global _api_call_count, _api_call_details
     total_tokens = sum(d.get("tokens", 0) for d in _api_call_details)
-    print(f"\n📊 API USAGE SUMMARY:")
-    print(f"   Total Calls: {_api_call_count}")
-    print(f"   Total Tokens: {total_tokens}")
-    for d in _api_call_details:
-        print(f"   - Call {d['call_num']}: {d['model']} ({d['tokens']} tokens)")
+    # Build the whole report first and emit it with a single write
+    lines = [
+        "\n📊 API USAGE SUMMARY:",
+        f"   Total Calls: {_api_call_count}",
+        f"   Total Tokens: {total_tokens}",
+    ]
+    lines.extend(
+        f"   - Call {d['call_num']}: {d['model']} ({d['tokens']} tokens)"
+        for d in _api_call_details
+    )
+    sys.stdout.write("\n".join(lines) + "\n")
 
@@ -5,7 +5,23 @@ Unified parser for extracting data from markdown tables.
 Consolidates logic from graph_pipeline.py and graph_builder.py
 """
 import re
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Sequence
+
+# Markdown separator row, e.g. |:---|---:|
+_SEPARATOR_RE = re.compile(r'^\|[\s\-:]+\|')
+
+# Column-name patterns for time-series label detection (shared with graph_pipeline).
+# Year/quarter columns match by prefix, date-like columns by substring.
+YEAR_COLUMN_PREFIXES = ('yr', 'year', 'fiscal_year', 'fy')
+QUARTER_COLUMN_PREFIXES = ('qtr', 'quarter', 'fiscal_quarter', 'q')
+DATE_COLUMN_PATTERNS = ('date', 'month', 'mo', 'period', 'time')
+
+DEFAULT_LABEL_COLUMNS = ('company_name', 'name', 'company', 'date', 'period')
+DEFAULT_VALUE_COLUMNS = ('actual_value', 'revenue', 'value', 'val', 'close',
+                         'total', 'net_income', 'amount')
+# Identifier/date columns never picked as the value column
+_NON_VALUE_COLUMNS = frozenset(('yr', 'qtr', 'mo', 'wk', 'date', 'quarter', 'month',
+                                'status', 'metric', 'year'))
 
 
 def parse_markdown_table(text: str) -> Optional[Dict[str, List[Any]]]:
@@ -49,7 +65,7 @@ def parse_markdown_table(text: str) -> Optional[Dict[str, List[Any]]]:
     
     # Skip separator line (|:---|:---|)
     data_start = 1
-    if len(table_lines) > 1 and re.match(r'^\|[\s\-:]+\|', table_lines[1]):
+    if len(table_lines) > 1 and _SEPARATOR_RE.match(table_lines[1]):
         data_start = 2
     
     # Parse data rows
@@ -66,8 +82,8 @@ def parse_markdown_table(text: str) -> Optional[Dict[str, List[Any]]]:
 
 def extract_labels_and_values(
     table_data: Dict[str, List[Any]],
-    preferred_label_cols: List[str] = None,
-    preferred_value_cols: List[str] = None
+    preferred_label_cols: Sequence[str] = None,
+    preferred_value_cols: Sequence[str] = None
 ) -> Dict[str, List]:
     """
     Extract labels and values from parsed table data.
@@ -89,41 +105,27 @@ def extract_labels_and_values(
     
     # Default preference orders
     if preferred_label_cols is None:
-        preferred_label_cols = ['company_name', 'name', 'company', 'date', 'period']
+        preferred_label_cols = DEFAULT_LABEL_COLUMNS
     
     if preferred_value_cols is None:
-        preferred_value_cols = ['actual_value', 'revenue', 'value', 'val', 'close', 
-                                'total', 'net_income', 'amount']
+        preferred_value_cols = DEFAULT_VALUE_COLUMNS
     
     # Find year and quarter columns for smart label creation
     year_col = None
     qtr_col = None
     date_col = None
     
-    year_patterns = ['yr', 'year', 'fiscal_year', 'fy']
-    qtr_patterns = ['qtr', 'quarter', 'fiscal_quarter', 'q']
-    date_patterns = ['date', 'month', 'mo', 'period', 'time']
-    
     for col in columns:
         col_lower = col.lower()
         # Check for year column
-        if year_col is None:
-            for pattern in year_patterns:
-                if pattern == col_lower or col_lower.startswith(pattern):
-                    year_col = col
-                    break
+        if year_col is None and col_lower.startswith(YEAR_COLUMN_PREFIXES):
+            year_col = col
         # Check for quarter column
-        if qtr_col is None:
-            for pattern in qtr_patterns:
-                if pattern == col_lower or col_lower.startswith(pattern):
-                    qtr_col = col
-                    break
+        if qtr_col is None and col_lower.startswith(QUARTER_COLUMN_PREFIXES):
+            qtr_col = col
         # Check for date column
-        if date_col is None:
-            for pattern in date_patterns:
-                if pattern in col_lower:
-                    date_col = col
-                    break
+        if date_col is None and any(pattern in col_lower for pattern in DATE_COLUMN_PATTERNS):
+            date_col = col
     
     # Extract labels with smart combining
     labels = []
@@ -167,11 +169,9 @@ def extract_labels_and_values(
     
     # Fallback: find last numeric column that's not a date/identifier
     if not value_col:
-        skip_cols = ['yr', 'qtr', 'mo', 'wk', 'date', 'quarter', 'month', 
-                     'status', 'metric', 'year']
         for col in reversed(columns):
             col_lower = col.lower()
-            if col_lower not in skip_cols and 'pct' not in col_lower and 'percent' not in col_lower:
+            if col_lower not in _NON_VALUE_COLUMNS and 'pct' not in col_lower and 'percent' not in col_lower:
                 value_col = col
                 break
     